@@ -8,20 +8,29 @@ Provides REST API endpoints for ML predictions:
 - Delivery performance analytics
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict
+from functools import lru_cache
+from operator import itemgetter
+import anyio
+import orjson
 import uvicorn
+import numpy as np
 from pathlib import Path
+import os
 import sys
 
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from models.driver_scoring import DriverScoringModel
-from models.maintenance_prediction import MaintenancePredictionModel
+from models.driver_scoring import DriverScoringModel, DRIVER_FIELDS
+from models.maintenance_prediction import MaintenancePredictionModel, VEHICLE_FIELDS
 from models.demand_forecast import DemandForecastModel
 from models.delay_prediction import DelayPredictionModel
 from models.incident_risk import IncidentRiskModel
@@ -33,7 +42,8 @@ from models.eta_prediction import ETAPredictionModel
 app = FastAPI(
     title="MilesConnect ML Service",
     description="Machine Learning service for predictive analytics in logistics",
-    version="1.1.0"
+    version="1.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -45,6 +55,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger payloads (7-day forecasts, batch driver scores)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Load ML models
 model_dir = Path(__file__).parent.parent.parent / "models"
 driver_model = DriverScoringModel()
@@ -78,6 +91,74 @@ load_model(cluster_model, "driver_clustering")
 load_model(eta_model, "eta_prediction")
 
 
+# Health probes are answered before routing with a body serialized once at startup
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "MilesConnect ML Service",
+    "models": models_status
+})
+
+class HealthCheckMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(HEALTH_BODY)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
+
+app.add_middleware(HealthCheckMiddleware)
+
+
+# Model feature vectors straight from a request model's field dict
+driver_features = itemgetter(*DRIVER_FIELDS)
+vehicle_features = itemgetter(*VEHICLE_FIELDS)
+
+
+# Dashboards poll the same drivers repeatedly; identical feature vectors skip inference
+@lru_cache(maxsize=4096)
+def cached_driver_predict(features):
+    return float(driver_model.predict(np.asarray(features, dtype=np.float64))[0])
+
+
+# Blocking model inference runs in the threadpool; raise the default limit (40)
+INFERENCE_THREAD_LIMIT = 100
+
+@app.on_event("startup")
+async def configure_threadpool():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = INFERENCE_THREAD_LIMIT
+
+
+@app.on_event("startup")
+async def warmup_models():
+    """Run each loaded model once so the first real request doesn't pay lazy-init cost"""
+    for obj, name in [
+        (driver_model, "driver_scoring"),
+        (maintenance_model, "maintenance_prediction"),
+        (demand_model, "demand_forecast"),
+        (delay_model, "delay_prediction"),
+        (risk_model, "incident_risk"),
+        (fuel_model, "fuel_anomaly"),
+        (cluster_model, "driver_clustering"),
+        (eta_model, "eta_prediction"),
+    ]:
+        if obj.model is None:
+            continue
+        try:
+            obj.predict({k: 0 for k in obj.feature_columns})
+        except Exception as e:
+            print(f"⚠ {name} warm-up failed: {e}")
+
+
 # Pydantic models for request/response
 class DriverData(BaseModel):
     driver_id: Optional[str] = None
@@ -202,7 +283,7 @@ class ETAResponse(BaseModel):
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (served by HealthCheckMiddleware; kept for the OpenAPI schema)"""
     return {
         "status": "healthy",
         "service": "MilesConnect ML Service",
@@ -210,122 +291,125 @@ async def health_check():
     }
 
 
-@app.post("/api/ml/driver-score", response_model=DriverScoreResponse)
-async def calculate_driver_score(data: DriverData):
-    """Calculate driver performance score"""
+@app.post("/api/ml/driver-score", responses={200: {"model": DriverScoreResponse}})
+async def calculate_driver_score(data: DriverData, x_no_cache: bool = Header(False)):
+    """Calculate driver performance score (send `X-No-Cache: true` to bypass the cache)"""
     try:
         if driver_model.model is None:
             raise HTTPException(status_code=503, detail="Driver scoring model not available")
         
-        driver_dict = data.dict()
-        score = driver_model.predict(driver_dict)[0]
+        features = driver_features(data.__dict__)
+        if x_no_cache:
+            score = (await run_in_threadpool(driver_model.predict, np.asarray(features, dtype=np.float64)))[0]
+        else:
+            score = await run_in_threadpool(cached_driver_predict, features)
         
         on_time_rate = data.on_time_deliveries / (data.total_trips + 1)
         safety_events = data.harsh_braking_count + data.harsh_acceleration_count
         safety_score = max(0, 100 - (safety_events / (data.total_trips + 1)) * 50)
         
-        return DriverScoreResponse(
-            driver_id=data.driver_id,
-            score=round(score, 2),
-            metrics={
+        return {
+            "driver_id": data.driver_id,
+            "score": round(float(score), 2),
+            "metrics": {
                 "on_time_delivery_rate": round(on_time_rate * 100, 2),
                 "fuel_efficiency_kmpl": round(data.fuel_efficiency_kmpl, 2),
                 "safety_score": round(safety_score, 2),
                 "customer_rating": round(data.customer_rating, 2),
                 "experience_months": data.experience_months
             }
-        )
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/ml/maintenance-prediction", response_model=MaintenancePredictionResponse)
+@app.post("/api/ml/maintenance-prediction", responses={200: {"model": MaintenancePredictionResponse}})
 async def predict_maintenance(data: VehicleData):
     """Predict vehicle maintenance needs"""
     try:
         if maintenance_model.model is None:
             raise HTTPException(status_code=503, detail="Maintenance prediction model not available")
         
-        vehicle_dict = data.dict()
-        result = maintenance_model.predict(vehicle_dict)[0]
+        features = np.asarray(vehicle_features(data.__dict__), dtype=np.float64)
+        result = (await run_in_threadpool(maintenance_model.predict, features))[0]
         
-        return MaintenancePredictionResponse(
-            vehicle_id=data.vehicle_id,
-            predicted_class=result['predicted_class'],
-            confidence=round(result['confidence'], 4),
-            days_until_maintenance=result['days_until_maintenance'],
-            class_probabilities=result['class_probabilities']
-        )
+        return {
+            "vehicle_id": data.vehicle_id,
+            "predicted_class": str(result['predicted_class']),
+            "confidence": round(result['confidence'], 4),
+            "days_until_maintenance": int(result['days_until_maintenance']),
+            "class_probabilities": result['class_probabilities']
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/ml/demand-forecast", response_model=DemandForecastResponse)
+@app.post("/api/ml/demand-forecast", responses={200: {"model": DemandForecastResponse}})
 async def forecast_demand(data: DemandForecastData):
     """Forecast shipment demand"""
     try:
         if demand_model.model is None:
             raise HTTPException(status_code=503, detail="Demand forecast model not available")
         
-        forecast_dict = data.dict()
-        prediction = demand_model.predict(forecast_dict)[0]
-        forecast_7d = demand_model.forecast_next_n_days(forecast_dict, n_days=7)
+        forecast_dict = data.model_dump()
+        prediction = (await run_in_threadpool(demand_model.predict, forecast_dict))[0]
+        forecast_7d = await run_in_threadpool(demand_model.forecast_next_n_days, forecast_dict, n_days=7)
         
-        return DemandForecastResponse(
-            predicted_shipments=int(prediction),
-            forecast_7d=forecast_7d
-        )
+        return {
+            "predicted_shipments": int(prediction),
+            "forecast_7d": forecast_7d
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # New Endpoints
 
-@app.post("/api/ml/predict-delay", response_model=DelayPredictionResponse)
+@app.post("/api/ml/predict-delay", responses={200: {"model": DelayPredictionResponse}})
 async def predict_delay(data: RouteData):
     try:
         if delay_model.model is None:
             raise HTTPException(status_code=503, detail="Delay prediction model not available")
-        result = delay_model.predict(data.dict())
+        result = await run_in_threadpool(delay_model.predict, data.model_dump())
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/ml/incident-risk", response_model=RiskResponse)
+@app.post("/api/ml/incident-risk", responses={200: {"model": RiskResponse}})
 async def predict_incident_risk(data: RiskInputData):
     try:
         if risk_model.model is None:
             raise HTTPException(status_code=503, detail="Incident risk model not available")
-        score = risk_model.predict(data.dict())
+        score = await run_in_threadpool(risk_model.predict, data.model_dump())
         return {"risk_score": score}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/ml/fuel-anomaly", response_model=FuelAnomalyResponse)
+@app.post("/api/ml/fuel-anomaly", responses={200: {"model": FuelAnomalyResponse}})
 async def detect_fuel_anomaly(data: FuelData):
     try:
         if fuel_model.model is None:
             raise HTTPException(status_code=503, detail="Fuel anomaly model not available")
-        result = fuel_model.predict(data.dict())
+        result = await run_in_threadpool(fuel_model.predict, data.model_dump())
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/ml/driver-clustering", response_model=DriverClusterResponse)
+@app.post("/api/ml/driver-clustering", responses={200: {"model": DriverClusterResponse}})
 async def cluster_driver(data: DriverClusterData):
     try:
         if cluster_model.model is None:
              raise HTTPException(status_code=503, detail="Driver clustering model not available")
-        result = cluster_model.predict(data.dict())
+        result = await run_in_threadpool(cluster_model.predict, data.model_dump())
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/ml/predict-eta", response_model=ETAResponse)
+@app.post("/api/ml/predict-eta", responses={200: {"model": ETAResponse}})
 async def predict_eta(data: TripData):
     try:
          if eta_model.model is None:
             raise HTTPException(status_code=503, detail="ETA prediction model not available")
-         eta = eta_model.predict(data.dict())
+         eta = await run_in_threadpool(eta_model.predict, data.model_dump())
          return {"predicted_duration_mins": eta}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -338,37 +422,65 @@ async def calculate_driver_scores_batch(drivers: List[DriverData]):
         if driver_model.model is None:
             raise HTTPException(status_code=503, detail="Driver scoring model not available")
         
-        results = []
-        for driver in drivers:
-            score = driver_model.predict(driver.dict())[0]
-            on_time_rate = driver.on_time_deliveries / (driver.total_trips + 1)
-            safety_events = driver.harsh_braking_count + driver.harsh_acceleration_count
-            safety_score = max(0, 100 - (safety_events / (driver.total_trips + 1)) * 50)
-            
-            results.append({
+        if not drivers:
+            return ORJSONResponse(content={"drivers": []})
+        
+        # Single inference call for the whole batch
+        features = np.array([driver_features(driver.__dict__) for driver in drivers], dtype=np.float64)
+        scores = await run_in_threadpool(driver_model.predict, features)
+        
+        total_trips = np.array([driver.total_trips for driver in drivers])
+        on_time_deliveries = np.array([driver.on_time_deliveries for driver in drivers])
+        safety_events = np.array([
+            driver.harsh_braking_count + driver.harsh_acceleration_count for driver in drivers
+        ])
+        fuel_efficiency = np.array([driver.fuel_efficiency_kmpl for driver in drivers])
+        customer_rating = np.array([driver.customer_rating for driver in drivers])
+        
+        on_time_rate = on_time_deliveries / (total_trips + 1)
+        safety_score = np.maximum(0, 100 - (safety_events / (total_trips + 1)) * 50)
+        
+        results = [
+            {
                 "driver_id": driver.driver_id,
-                "score": round(score, 2),
+                "score": score,
                 "metrics": {
-                    "on_time_delivery_rate": round(on_time_rate * 100, 2),
-                    "fuel_efficiency_kmpl": round(driver.fuel_efficiency_kmpl, 2),
-                    "safety_score": round(safety_score, 2),
-                    "customer_rating": round(driver.customer_rating, 2)
+                    "on_time_delivery_rate": rate,
+                    "fuel_efficiency_kmpl": fuel,
+                    "safety_score": safety,
+                    "customer_rating": rating
                 }
-            })
+            }
+            for driver, score, rate, fuel, safety, rating in zip(
+                drivers,
+                np.round(scores.astype(np.float64), 2).tolist(),
+                np.round(on_time_rate * 100, 2).tolist(),
+                np.round(fuel_efficiency, 2).tolist(),
+                np.round(safety_score, 2).tolist(),
+                np.round(customer_rating, 2).tolist()
+            )
+        ]
         
         # Sort by score descending
         results.sort(key=lambda x: x['score'], reverse=True)
         
-        return {"drivers": results}
+        return ORJSONResponse(content={"drivers": results})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Run server
 if __name__ == "__main__":
+    # Auto-reload is for local development only; production runs one worker per core
+    reload = os.getenv("ML_SERVICE_RELOAD", "true").lower() == "true"
+    
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=reload,
+        workers=None if reload else os.cpu_count(),
+        # "auto" picks uvloop/httptools when installed (uvloop isn't available on Windows)
+        loop="auto",
+        http="auto"
     )
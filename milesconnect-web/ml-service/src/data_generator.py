@@ -9,177 +9,238 @@ Generates realistic training data for:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from numba import njit
 from datetime import datetime, timedelta
-import random
 import json
 from pathlib import Path
 
 
+_MAKES_MODELS = np.asarray([
+    "Tata Ace Gold", "Mahindra Jeeto", "Eicher Pro 3015",
+    "Ashok Leyland Dost", "Force Motors Traveller",
+    "Maruti Suzuki Super Carry", "Piaggio Ape Auto"
+])
+
+
+def _trailing_mean(values, window):
+    """Integer mean of the `window` values preceding each day (O(n) via prefix sums).
+    
+    Days without a full window of history fall back to their own value.
+    """
+    values = np.asarray(values)
+    cumsum = np.concatenate(([0], np.cumsum(values)))
+    result = values.copy()
+    result[window:] = ((cumsum[window:-1] - cumsum[:-window - 1]) / window).astype(int)
+    return result
+
+
+@njit(cache=True, fastmath=True)
+def _driver_score_kernel(on_time_rate, fuel_efficiency, harsh_events, total_trips,
+                         customer_rating, experience_factor, out):
+    """Fused driver score: on-time (35%), fuel (20%), safety (25%), rating (10%), experience (10%)"""
+    for i in range(out.shape[0]):
+        safety_score = 100 * (1 - harsh_events[i] / (total_trips[i] * 2))
+        safety_score = min(max(safety_score, 0.0), 100.0)
+        out[i] = (
+            on_time_rate[i] * 35 +
+            (fuel_efficiency[i] / 18) * 20 +
+            (safety_score / 100) * 25 +
+            (customer_rating[i] / 5) * 10 +
+            experience_factor[i] * 10
+        )
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _maintenance_risk_kernel(days_since_maintenance, odometer_km, harsh_usage_score,
+                             age_months, reported_issues, out):
+    """Fused maintenance risk: days since service, odometer, harsh usage, age, issues"""
+    for i in range(out.shape[0]):
+        out[i] = (
+            (days_since_maintenance[i] / 90) * 30 +
+            (odometer_km[i] / 150000) * 25 +
+            (harsh_usage_score[i] / 100) * 20 +
+            (age_months[i] / 60) * 15 +
+            (reported_issues[i] / 5) * 10
+        )
+    return out
+
+
 class SyntheticDataGenerator:
-    def __init__(self, seed=42):
-        np.random.seed(seed)
-        random.seed(seed)
+    def __init__(self, seed=42, write_parquet=False):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.write_parquet = write_parquet
         self.output_dir = Path(__file__).parent.parent / "data"
         self.output_dir.mkdir(exist_ok=True)
     
+    def _with_seed_offset(self, offset):
+        """Independent generator (own RNG stream) writing to the same output directory"""
+        generator = SyntheticDataGenerator(self.seed + offset, self.write_parquet)
+        generator.output_dir = self.output_dir
+        return generator
+    
+    def _save(self, df, filename):
+        """Write a dataset as CSV (and optionally Parquet) using PyArrow's C++ writers"""
+        output_path = self.output_dir / filename
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, output_path)
+        if self.write_parquet:
+            pq.write_table(table, output_path.with_suffix(".parquet"), compression="zstd")
+        return output_path
+    
     def generate_driver_data(self, n_drivers=100):
         """Generate synthetic driver performance data"""
-        data = []
+        driver_ids = [f"DR-{i+1:04d}" for i in range(n_drivers)]
+        experience_months = self.rng.integers(6, 120, n_drivers, dtype=np.int16)  # 6 months to 10 years
         
-        for i in range(n_drivers):
-            driver_id = f"DR-{i+1:04d}"
-            experience_months = np.random.randint(6, 120)  # 6 months to 10 years
-            
-            # Base performance influenced by experience
-            experience_factor = min(experience_months / 60, 1.0)  # Caps at 5 years
-            
-            total_trips = np.random.randint(50, 500)
-            
-            # On-time delivery rate (70-98%, better with experience)
-            base_on_time_rate = 0.7 + (experience_factor * 0.2)
-            on_time_rate = np.clip(np.random.normal(base_on_time_rate, 0.1), 0.5, 0.99)
-            on_time_deliveries = int(total_trips * on_time_rate)
-            late_deliveries = total_trips - on_time_deliveries
-            
-            # Average speed (40-80 km/h)
-            avg_speed = np.random.uniform(40, 80)
-            
-            # Safety metrics (harsh events, inversely related to experience)
-            harsh_braking_count = np.random.poisson(max(20 - (experience_factor * 15), 5))
-            harsh_acceleration_count = np.random.poisson(max(25 - (experience_factor * 18), 7))
-            
-            # Idle time (10-60 mins per trip on average)
-            idle_time_mins = np.random.uniform(10, 60) * total_trips
-            
-            # Fuel efficiency (8-18 km/l, better with experience)
-            base_fuel_eff = 10 + (experience_factor * 4)
-            fuel_efficiency = np.clip(np.random.normal(base_fuel_eff, 2), 8, 18)
-            
-            # Total distance
-            distance_km = total_trips * np.random.uniform(30, 150)
-            
-            # Incidents (rare, 0-3)
-            incident_count = np.random.choice([0, 0, 0, 1, 1, 2], p=[0.5, 0.3, 0.1, 0.05, 0.03, 0.02])
-            
-            # Customer rating (3.5-5.0, correlated with on-time rate)
-            customer_rating = np.clip(3.0 + (on_time_rate * 2) + np.random.normal(0, 0.3), 3.0, 5.0)
-            
-            # Calculate driver score (0-100)
-            # Weights: on-time (35%), fuel (20%), safety (25%), rating (10%), experience (10%)
-            safety_score = 100 * (1 - (harsh_braking_count + harsh_acceleration_count) / (total_trips * 2))
-            safety_score = max(0, min(100, safety_score))
-            
-            driver_score = (
-                on_time_rate * 35 +
-                (fuel_efficiency / 18) * 20 +
-                (safety_score / 100) * 25 +
-                (customer_rating / 5) * 10 +
-                experience_factor * 10
-            )
-            
-            data.append({
-                'driver_id': driver_id,
-                'total_trips': total_trips,
-                'on_time_deliveries': on_time_deliveries,
-                'late_deliveries': late_deliveries,
-                'avg_speed_kmh': round(avg_speed, 2),
-                'harsh_braking_count': harsh_braking_count,
-                'harsh_acceleration_count': harsh_acceleration_count,
-                'idle_time_mins': round(idle_time_mins, 2),
-                'fuel_efficiency_kmpl': round(fuel_efficiency, 2),
-                'distance_km': round(distance_km, 2),
-                'experience_months': experience_months,
-                'incident_count': incident_count,
-                'customer_rating': round(customer_rating, 2),
-                'driver_score': round(driver_score, 2)
-            })
+        # Base performance influenced by experience
+        experience_factor = np.minimum(experience_months / 60, 1.0)  # Caps at 5 years
         
-        df = pd.DataFrame(data)
-        output_path = self.output_dir / "driver_performance.csv"
-        df.to_csv(output_path, index=False)
+        total_trips = self.rng.integers(50, 500, n_drivers, dtype=np.int16)
+        
+        # On-time delivery rate (70-98%, better with experience)
+        base_on_time_rate = 0.7 + (experience_factor * 0.2)
+        on_time_rate = np.clip(self.rng.normal(base_on_time_rate, 0.1), 0.5, 0.99)
+        on_time_deliveries = (total_trips * on_time_rate).astype(np.int16)
+        late_deliveries = total_trips - on_time_deliveries
+        
+        # Average speed (40-80 km/h)
+        avg_speed = self.rng.uniform(40, 80, n_drivers)
+        
+        # Safety metrics (harsh events, inversely related to experience)
+        harsh_braking_count = self.rng.poisson(np.maximum(20 - (experience_factor * 15), 5)).astype(np.int16)
+        harsh_acceleration_count = self.rng.poisson(np.maximum(25 - (experience_factor * 18), 7)).astype(np.int16)
+        
+        # Idle time (10-60 mins per trip on average)
+        idle_time_mins = self.rng.uniform(10, 60, n_drivers) * total_trips
+        
+        # Fuel efficiency (8-18 km/l, better with experience)
+        base_fuel_eff = 10 + (experience_factor * 4)
+        fuel_efficiency = np.clip(self.rng.normal(base_fuel_eff, 2), 8, 18)
+        
+        # Total distance
+        distance_km = total_trips * self.rng.uniform(30, 150, n_drivers)
+        
+        # Incidents (rare, 0-3)
+        incident_count = self.rng.choice(
+            [0, 0, 0, 1, 1, 2], size=n_drivers, p=[0.5, 0.3, 0.1, 0.05, 0.03, 0.02]
+        ).astype(np.int8)
+        
+        # Customer rating (3.5-5.0, correlated with on-time rate)
+        customer_rating = np.clip(3.0 + (on_time_rate * 2) + self.rng.normal(0, 0.3, n_drivers), 3.0, 5.0)
+        
+        # Calculate driver score (0-100)
+        driver_score = _driver_score_kernel(
+            on_time_rate, fuel_efficiency,
+            harsh_braking_count + harsh_acceleration_count, total_trips,
+            customer_rating, experience_factor,
+            np.empty(n_drivers, dtype=np.float32)
+        )
+        
+        df = pd.DataFrame({
+            'driver_id': driver_ids,
+            'total_trips': total_trips,
+            'on_time_deliveries': on_time_deliveries,
+            'late_deliveries': late_deliveries,
+            'avg_speed_kmh': avg_speed.astype(np.float32, copy=False),
+            'harsh_braking_count': harsh_braking_count,
+            'harsh_acceleration_count': harsh_acceleration_count,
+            'idle_time_mins': idle_time_mins,
+            'fuel_efficiency_kmpl': fuel_efficiency.astype(np.float32, copy=False),
+            'distance_km': distance_km,
+            'experience_months': experience_months,
+            'incident_count': incident_count,
+            'customer_rating': customer_rating.astype(np.float32, copy=False),
+            'driver_score': driver_score
+        }, copy=False)
+        df = df.round({
+            'avg_speed_kmh': 2,
+            'idle_time_mins': 2,
+            'fuel_efficiency_kmpl': 2,
+            'distance_km': 2,
+            'customer_rating': 2,
+            'driver_score': 2
+        })
+        
+        output_path = self._save(df, "driver_performance.csv")
         print(f"✓ Generated {len(df)} driver records → {output_path}")
         return df
     
     def generate_maintenance_data(self, n_vehicles=80):
         """Generate synthetic vehicle maintenance data"""
-        data = []
-        makes_models = [
-            "Tata Ace Gold", "Mahindra Jeeto", "Eicher Pro 3015",
-            "Ashok Leyland Dost", "Force Motors Traveller",
-            "Maruti Suzuki Super Carry", "Piaggio Ape Auto"
-        ]
+        vehicle_ids = [f"VH-{i+1:04d}" for i in range(n_vehicles)]
+        age_months = self.rng.integers(6, 60, n_vehicles, dtype=np.int16)  # 6 months to 5 years
+        make_model = _MAKES_MODELS[self.rng.integers(0, _MAKES_MODELS.size, n_vehicles)]
         
-        for i in range(n_vehicles):
-            vehicle_id = f"VH-{i+1:04d}"
-            age_months = np.random.randint(6, 60)  # 6 months to 5 years
-            make_model = random.choice(makes_models)
-            
-            # Odometer (20k-150k km based on age)
-            base_km = age_months * np.random.uniform(500, 2500)
-            odometer_km = int(base_km + np.random.normal(0, 5000))
-            
-            # Last maintenance (0-90 days ago)
-            days_since_maintenance = np.random.randint(0, 90)
-            
-            # Usage patterns
-            total_trips = np.random.randint(100, 800)
-            avg_trip_distance = odometer_km / total_trips if total_trips > 0 else 50
-            
-            # Harsh usage score (0-100, higher = more harsh)
-            harsh_usage_score = np.random.uniform(20, 80)
-            
-            # Fuel consumption variance (0-30%, higher = potential issue)
-            fuel_variance = np.random.uniform(0, 30)
-            
-            # Reported issues
-            reported_issues = np.random.poisson(age_months / 12)  # More issues with age
-            
-            # Determine maintenance risk
-            # Factors: days since maintenance, odometer, harsh usage, age
-            risk_score = (
-                (days_since_maintenance / 90) * 30 +
-                (odometer_km / 150000) * 25 +
-                (harsh_usage_score / 100) * 20 +
-                (age_months / 60) * 15 +
-                (reported_issues / 5) * 10
-            )
-            
-            # days until maintenance needed
-            if risk_score > 70:
-                maintenance_class = "immediate"
-                days_until = np.random.randint(1, 7)
-            elif risk_score > 40:
-                maintenance_class = "soon"
-                days_until = np.random.randint(7, 30)
-            else:
-                maintenance_class = "normal"
-                days_until = np.random.randint(30, 90)
-            
-            data.append({
-                'vehicle_id': vehicle_id,
-                'make_model': make_model,
-                'age_months': age_months,
-                'odometer_km': odometer_km,
-                'days_since_last_maintenance': days_since_maintenance,
-                'total_trips': total_trips,
-                'avg_trip_distance_km': round(avg_trip_distance, 2),
-                'harsh_usage_score': round(harsh_usage_score, 2),
-                'fuel_consumption_variance': round(fuel_variance, 2),
-                'reported_issues_count': reported_issues,
-                'maintenance_class': maintenance_class,
-                'days_until_maintenance': days_until,
-                'risk_score': round(risk_score, 2)
-            })
+        # Odometer (20k-150k km based on age)
+        base_km = age_months * self.rng.uniform(500, 2500, n_vehicles)
+        odometer_km = (base_km + self.rng.normal(0, 5000, n_vehicles)).astype(np.int32)
         
-        df = pd.DataFrame(data)
-        output_path = self.output_dir / "vehicle_maintenance.csv"
-        df.to_csv(output_path, index=False)
+        # Last maintenance (0-90 days ago)
+        days_since_maintenance = self.rng.integers(0, 90, n_vehicles, dtype=np.int16)
+        
+        # Usage patterns
+        total_trips = self.rng.integers(100, 800, n_vehicles, dtype=np.int16)
+        avg_trip_distance = odometer_km / total_trips
+        
+        # Harsh usage score (0-100, higher = more harsh)
+        harsh_usage_score = self.rng.uniform(20, 80, n_vehicles)
+        
+        # Fuel consumption variance (0-30%, higher = potential issue)
+        fuel_variance = self.rng.uniform(0, 30, n_vehicles)
+        
+        # Reported issues
+        reported_issues = self.rng.poisson(age_months / 12).astype(np.int16)  # More issues with age
+        
+        # Determine maintenance risk
+        # Factors: days since maintenance, odometer, harsh usage, age
+        risk_score = _maintenance_risk_kernel(
+            days_since_maintenance, odometer_km, harsh_usage_score,
+            age_months, reported_issues,
+            np.empty(n_vehicles, dtype=np.float32)
+        )
+        
+        # days until maintenance needed
+        is_immediate = risk_score > 70
+        is_soon = risk_score > 40
+        maintenance_class = np.select([is_immediate, is_soon], ["immediate", "soon"], default="normal")
+        days_immediate = self.rng.integers(1, 7, n_vehicles, dtype=np.int16)
+        days_soon = self.rng.integers(7, 30, n_vehicles, dtype=np.int16)
+        days_normal = self.rng.integers(30, 90, n_vehicles, dtype=np.int16)
+        days_until = np.where(is_immediate, days_immediate, np.where(is_soon, days_soon, days_normal))
+        
+        df = pd.DataFrame({
+            'vehicle_id': vehicle_ids,
+            'make_model': make_model,
+            'age_months': age_months,
+            'odometer_km': odometer_km,
+            'days_since_last_maintenance': days_since_maintenance,
+            'total_trips': total_trips,
+            'avg_trip_distance_km': avg_trip_distance.astype(np.float32, copy=False),
+            'harsh_usage_score': harsh_usage_score.astype(np.float32, copy=False),
+            'fuel_consumption_variance': fuel_variance.astype(np.float32, copy=False),
+            'reported_issues_count': reported_issues,
+            'maintenance_class': maintenance_class,
+            'days_until_maintenance': days_until,
+            'risk_score': risk_score
+        }, copy=False)
+        df = df.round({
+            'avg_trip_distance_km': 2,
+            'harsh_usage_score': 2,
+            'fuel_consumption_variance': 2,
+            'risk_score': 2
+        })
+        
+        output_path = self._save(df, "vehicle_maintenance.csv")
         print(f"✓ Generated {len(df)} vehicle maintenance records → {output_path}")
         return df
     
     def generate_demand_forecast_data(self, n_days=730):
         """Generate synthetic shipment demand data (2 years)"""
-        data = []
         start_date = datetime.now() - timedelta(days=n_days)
         
         # Base trend (slight growth over time)
@@ -192,75 +253,61 @@ class SyntheticDataGenerator:
             "2024-10-31", "2024-11-01", "2024-12-25",
             "2025-01-26", "2025-03-14", "2025-08-15", "2025-10-02"
         ]
-        holiday_dates = set(holidays)
         
-        for day in range(n_days):
-            current_date = start_date + timedelta(days=day)
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Day of week effect (weekdays higher)
-            day_of_week = current_date.weekday()
-            dow_factor = 1.2 if day_of_week < 5 else 0.6  # Mon-Fri vs Sat-Sun
-            
-            # Monthly seasonality (higher in Q4, festival season)
-            month = current_date.month
-            if month in [10, 11, 12]:  # Diwali, year-end
-                seasonal_factor = 1.3
-            elif month in [6, 7, 8]:  # Monsoon slowdown
-                seasonal_factor = 0.9
-            else:
-                seasonal_factor = 1.0
-            
-            # Holiday effect (reduced demand)
-            is_holiday = date_str in holiday_dates
-            holiday_factor = 0.5 if is_holiday else 1.0
-            
-            # Trend
-            trend = base_demand + (day * growth_rate * base_demand)
-            
-            # Random noise
-            noise = np.random.normal(0, 5)
-            
-            # Calculate demand
-            shipments = max(0, int(
-                trend * dow_factor * seasonal_factor * holiday_factor + noise
-            ))
-            
-            # Historical context (rolling averages)
-            if day >= 7:
-                last_7d = [data[i]['shipments'] for i in range(max(0, day-7), day)]
-                hist_7d = int(np.mean(last_7d))
-            else:
-                hist_7d = shipments
-            
-            if day >= 30:
-                last_30d = [data[i]['shipments'] for i in range(max(0, day-30), day)]
-                hist_30d = int(np.mean(last_30d))
-            else:
-                hist_30d = shipments
-            
-            # Average shipment weight
-            avg_weight = np.random.uniform(200, 800)
-            
-            # Active vehicles (correlated with demand)
-            active_vehicles = int(np.clip(shipments /10, 5, 15))
-            
-            data.append({
-                'date': date_str,
-                'day_of_week': day_of_week,
-                'month': month,
-                'is_holiday': is_holiday,
-                'historical_shipments_7d': hist_7d,
-                'historical_shipments_30d': hist_30d,
-                'avg_shipment_weight_kg': round(avg_weight, 2),
-                'active_vehicles_count': active_vehicles,
-                'seasonal_index': round(seasonal_factor, 2),
-                'shipments': shipments
-            })
+        # Calendar columns
+        dates = pd.date_range(start_date, periods=n_days, freq="D")
+        date_str = dates.strftime("%Y-%m-%d").to_numpy()
+        day_of_week = dates.dayofweek.to_numpy().astype(np.int8)
+        month = dates.month.to_numpy().astype(np.int8)
         
-        df = pd.DataFrame(data)
-        output_path = self.output_dir / "demand_forecast.csv"
-        df.to_csv(output_path, index=False)
+        # Day of week effect (weekdays higher)
+        dow_factor = np.where(day_of_week < 5, 1.2, 0.6)  # Mon-Fri vs Sat-Sun
+        
+        # Monthly seasonality (higher in Q4, festival season)
+        seasonal_factor = np.select(
+            [np.isin(month, [10, 11, 12]),  # Diwali, year-end
+             np.isin(month, [6, 7, 8])],    # Monsoon slowdown
+            [1.3, 0.9],
+            default=1.0
+        )
+        
+        # Holiday effect (reduced demand)
+        is_holiday = np.isin(date_str, holidays)
+        holiday_factor = np.where(is_holiday, 0.5, 1.0)
+        
+        # Trend
+        trend = base_demand + (np.arange(n_days) * growth_rate * base_demand)
+        
+        # Random noise
+        noise = self.rng.normal(0, 5, n_days)
+        
+        # Calculate demand
+        shipments = np.maximum(0, (
+            trend * dow_factor * seasonal_factor * holiday_factor + noise
+        ).astype(np.int16))
+        
+        # Average shipment weight
+        avg_weight = self.rng.uniform(200, 800, n_days)
+        
+        # Active vehicles (correlated with demand)
+        active_vehicles = np.clip(shipments / 10, 5, 15).astype(np.int8)
+        
+        df = pd.DataFrame({
+            'date': date_str,
+            'day_of_week': day_of_week,
+            'month': month,
+            'is_holiday': is_holiday,
+            # Historical context (rolling averages of the preceding days)
+            'historical_shipments_7d': _trailing_mean(shipments, 7),
+            'historical_shipments_30d': _trailing_mean(shipments, 30),
+            'avg_shipment_weight_kg': avg_weight.astype(np.float32, copy=False),
+            'active_vehicles_count': active_vehicles,
+            'seasonal_index': seasonal_factor.astype(np.float32, copy=False),
+            'shipments': shipments
+        }, copy=False)
+        df = df.round({'avg_shipment_weight_kg': 2, 'seasonal_index': 2})
+        
+        output_path = self._save(df, "demand_forecast.csv")
         print(f"✓ Generated {len(df)} demand forecast records → {output_path}")
         return df
     
@@ -269,15 +316,15 @@ class SyntheticDataGenerator:
         """Generate synthetic delay prediction data"""
         data = []
         for _ in range(n_samples):
-            distance = np.random.uniform(50, 800)
-            num_stops = np.random.randint(1, 10)
-            traffic_score = np.random.uniform(0, 100)
-            weather_score = np.random.uniform(0, 100)
-            hist_delay = np.random.exponential(15) # Avg 15 min delay history
+            distance = self.rng.uniform(50, 800)
+            num_stops = self.rng.integers(1, 10)
+            traffic_score = self.rng.uniform(0, 100)
+            weather_score = self.rng.uniform(0, 100)
+            hist_delay = self.rng.exponential(15) # Avg 15 min delay history
             
-            vehicle_age = np.random.randint(1, 15)
-            departure_hour = np.random.randint(0, 24)
-            is_weekend = np.random.choice([0, 1], p=[0.7, 0.3])
+            vehicle_age = self.rng.integers(1, 15)
+            departure_hour = self.rng.integers(0, 24)
+            is_weekend = self.rng.choice([0, 1], p=[0.7, 0.3])
             
             # Logic to determine delay class
             risk_score = (
@@ -300,11 +347,11 @@ class SyntheticDataGenerator:
                 delay_class = "on_time"
                 
             data.append({
-                'total_distance_km': round(distance, 2),
+                'total_distance_km': distance,
                 'num_stops': num_stops,
-                'traffic_density_score': round(traffic_score, 2),
-                'weather_severity_score': round(weather_score, 2),
-                'historical_route_avg_delay_mins': round(hist_delay, 2),
+                'traffic_density_score': traffic_score,
+                'weather_severity_score': weather_score,
+                'historical_route_avg_delay_mins': hist_delay,
                 'departure_hour': departure_hour,
                 'is_weekend': is_weekend,
                 'vehicle_age_years': vehicle_age,
@@ -312,8 +359,13 @@ class SyntheticDataGenerator:
             })
             
         df = pd.DataFrame(data)
-        output_path = self.output_dir / "delay_prediction.csv"
-        df.to_csv(output_path, index=False)
+        df = df.round({
+            'total_distance_km': 2,
+            'traffic_density_score': 2,
+            'weather_severity_score': 2,
+            'historical_route_avg_delay_mins': 2
+        })
+        output_path = self._save(df, "delay_prediction.csv")
         print(f"✓ Generated {len(df)} delay prediction records → {output_path}")
         return df
 
@@ -321,14 +373,14 @@ class SyntheticDataGenerator:
         """Generate synthetic incident risk data"""
         data = []
         for _ in range(n_samples):
-            weather = np.random.uniform(0, 100) # 0=clear, 100=storm
-            traffic = np.random.uniform(0, 100)
-            road_quality = np.random.uniform(0, 100) # 0=poor, 100=good
-            fatigue = np.random.uniform(0, 10) # hours driven
-            vehicle_maint = np.random.uniform(0, 100) # 0=poor, 100=perfect
-            hist_accident = np.random.uniform(0, 0.05) # rate per km
+            weather = self.rng.uniform(0, 100) # 0=clear, 100=storm
+            traffic = self.rng.uniform(0, 100)
+            road_quality = self.rng.uniform(0, 100) # 0=poor, 100=good
+            fatigue = self.rng.uniform(0, 10) # hours driven
+            vehicle_maint = self.rng.uniform(0, 100) # 0=poor, 100=perfect
+            hist_accident = self.rng.uniform(0, 0.05) # rate per km
             
-            time_of_day_risk = np.random.uniform(0, 1)
+            time_of_day_risk = self.rng.uniform(0, 1)
             
             # Risk formula
             risk = (
@@ -340,22 +392,31 @@ class SyntheticDataGenerator:
                 (hist_accident * 100) * 10 +
                 time_of_day_risk * 5
             )
-            risk = np.clip(risk + np.random.normal(0, 5), 0, 100)
+            risk = np.clip(risk + self.rng.normal(0, 5), 0, 100)
             
             data.append({
-                'weather_condition_score': round(weather, 2),
-                'traffic_density': round(traffic, 2),
-                'road_quality_score': round(road_quality, 2),
-                'driver_fatigue_score': round(fatigue, 2),
-                'vehicle_maintenance_score': round(vehicle_maint, 2),
-                'route_historical_accident_rate': round(hist_accident, 4),
-                'time_of_day_risk': round(time_of_day_risk, 2),
-                'incident_risk_score': round(risk, 2)
+                'weather_condition_score': weather,
+                'traffic_density': traffic,
+                'road_quality_score': road_quality,
+                'driver_fatigue_score': fatigue,
+                'vehicle_maintenance_score': vehicle_maint,
+                'route_historical_accident_rate': hist_accident,
+                'time_of_day_risk': time_of_day_risk,
+                'incident_risk_score': risk
             })
             
         df = pd.DataFrame(data)
-        output_path = self.output_dir / "incident_risk.csv"
-        df.to_csv(output_path, index=False)
+        df = df.round({
+            'weather_condition_score': 2,
+            'traffic_density': 2,
+            'road_quality_score': 2,
+            'driver_fatigue_score': 2,
+            'vehicle_maintenance_score': 2,
+            'route_historical_accident_rate': 4,
+            'time_of_day_risk': 2,
+            'incident_risk_score': 2
+        })
+        output_path = self._save(df, "incident_risk.csv")
         print(f"✓ Generated {len(df)} incident risk records → {output_path}")
         return df
 
@@ -363,11 +424,11 @@ class SyntheticDataGenerator:
         """Generate fuel consumption data with anomalies"""
         data = []
         for _ in range(n_samples):
-            distance = np.random.uniform(50, 500)
-            load = np.random.uniform(0, 10000) # kg
-            speed = np.random.uniform(40, 80)
-            idle = np.random.uniform(10, 120)
-            elevation = np.random.uniform(0, 1000)
+            distance = self.rng.uniform(50, 500)
+            load = self.rng.uniform(0, 10000) # kg
+            speed = self.rng.uniform(40, 80)
+            idle = self.rng.uniform(10, 120)
+            elevation = self.rng.uniform(0, 1000)
             
             # Baseline fuel calc (approx)
             # Base 8km/l -> 0.125 l/km
@@ -385,29 +446,36 @@ class SyntheticDataGenerator:
             
             # Introduce anomalies (10% chance)
             is_anomaly = False
-            if np.random.random() < 0.1:
+            if self.rng.random() < 0.1:
                 is_anomaly = True
-                anomaly_type = np.random.choice(['theft', 'leak', 'inefficient'])
+                anomaly_type = self.rng.choice(['theft', 'leak', 'inefficient'])
                 if anomaly_type == 'theft':
-                    consumed *= np.random.uniform(1.2, 1.5) # Sudden drop not visible here, but total consumed is high for distance
+                    consumed *= self.rng.uniform(1.2, 1.5) # Sudden drop not visible here, but total consumed is high for distance
                 elif anomaly_type == 'leak':
-                    consumed *= np.random.uniform(1.3, 2.0)
+                    consumed *= self.rng.uniform(1.3, 2.0)
                 else:
                     consumed *= 1.15
             
             data.append({
-                'distance_km': round(distance, 2),
-                'fuel_consumed_liters': round(consumed, 2),
-                'load_weight_kg': round(load, 2),
-                'avg_speed_kmh': round(speed, 2),
-                'idle_time_mins': round(idle, 2),
-                'route_elevation_gain_m': round(elevation, 2),
+                'distance_km': distance,
+                'fuel_consumed_liters': consumed,
+                'load_weight_kg': load,
+                'avg_speed_kmh': speed,
+                'idle_time_mins': idle,
+                'route_elevation_gain_m': elevation,
                 'is_anomaly': is_anomaly # Label for verification, unsupervised training won't use it
             })
             
         df = pd.DataFrame(data)
-        output_path = self.output_dir / "fuel_anomaly.csv"
-        df.to_csv(output_path, index=False)
+        df = df.round({
+            'distance_km': 2,
+            'fuel_consumed_liters': 2,
+            'load_weight_kg': 2,
+            'avg_speed_kmh': 2,
+            'idle_time_mins': 2,
+            'route_elevation_gain_m': 2
+        })
+        output_path = self._save(df, "fuel_anomaly.csv")
         print(f"✓ Generated {len(df)} fuel records ({df['is_anomaly'].sum()} anomalies) → {output_path}")
         return df
         
@@ -428,27 +496,34 @@ class SyntheticDataGenerator:
         ]
         
         for _ in range(n_drivers):
-            profile = np.random.choice(profiles)
+            profile = self.rng.choice(profiles)
             
-            avg_speed = np.random.uniform(*profile['speed'])
-            harsh_acc = np.random.uniform(*profile['harsh'])
-            harsh_brake = np.random.uniform(*profile['harsh'])
-            idle_ratio = np.random.uniform(*profile['idle'])
-            night_ratio = np.random.uniform(*profile['night'])
-            avg_dist = np.random.uniform(*profile['dist'])
+            avg_speed = self.rng.uniform(*profile['speed'])
+            harsh_acc = self.rng.uniform(*profile['harsh'])
+            harsh_brake = self.rng.uniform(*profile['harsh'])
+            idle_ratio = self.rng.uniform(*profile['idle'])
+            night_ratio = self.rng.uniform(*profile['night'])
+            avg_dist = self.rng.uniform(*profile['dist'])
             
             data.append({
-                'avg_speed_kmh': round(avg_speed, 2),
-                'harsh_acceleration_count_per_100km': round(harsh_acc, 2),
-                'harsh_braking_count_per_100km': round(harsh_brake, 2),
-                'idling_ratio': round(idle_ratio, 3),
-                'night_driving_ratio': round(night_ratio, 3),
-                'average_trip_distance_km': round(avg_dist, 2)
+                'avg_speed_kmh': avg_speed,
+                'harsh_acceleration_count_per_100km': harsh_acc,
+                'harsh_braking_count_per_100km': harsh_brake,
+                'idling_ratio': idle_ratio,
+                'night_driving_ratio': night_ratio,
+                'average_trip_distance_km': avg_dist
             })
             
         df = pd.DataFrame(data)
-        output_path = self.output_dir / "driver_clustering.csv"
-        df.to_csv(output_path, index=False)
+        df = df.round({
+            'avg_speed_kmh': 2,
+            'harsh_acceleration_count_per_100km': 2,
+            'harsh_braking_count_per_100km': 2,
+            'idling_ratio': 3,
+            'night_driving_ratio': 3,
+            'average_trip_distance_km': 2
+        })
+        output_path = self._save(df, "driver_clustering.csv")
         print(f"✓ Generated {len(df)} driver profiles → {output_path}")
         return df
 
@@ -456,15 +531,15 @@ class SyntheticDataGenerator:
         """Generate synthetic ETA training data"""
         data = []
         for _ in range(n_samples):
-            distance = np.random.uniform(10, 1000)
+            distance = self.rng.uniform(10, 1000)
             base_speed = 60 # km/h
             base_duration = (distance / base_speed) * 60 # minutes
             
-            traffic = np.random.uniform(0, 100)
-            weather = np.random.uniform(1.0, 1.5) # multiplier
-            hour = np.random.randint(0, 24)
-            weekend = np.random.choice([0, 1], p=[0.7, 0.3])
-            urban = np.random.uniform(0, 100)
+            traffic = self.rng.uniform(0, 100)
+            weather = self.rng.uniform(1.0, 1.5) # multiplier
+            hour = self.rng.integers(0, 24)
+            weekend = self.rng.choice([0, 1], p=[0.7, 0.3])
+            urban = self.rng.uniform(0, 100)
             
             # Rush hour impact
             rush_hour = 0
@@ -479,22 +554,29 @@ class SyntheticDataGenerator:
             actual_duration = base_duration * traffic_factor * weather * rush_factor
             
             # Add noise
-            actual_duration *= np.random.normal(1.0, 0.05)
+            actual_duration *= self.rng.normal(1.0, 0.05)
             
             data.append({
-                'distance_km': round(distance, 2),
-                'base_duration_mins': round(base_duration, 2),
-                'traffic_density_score': round(traffic, 2),
-                'weather_factor': round(weather, 2),
+                'distance_km': distance,
+                'base_duration_mins': base_duration,
+                'traffic_density_score': traffic,
+                'weather_factor': weather,
                 'hour_of_day': hour,
                 'is_weekend': weekend,
-                'urban_density_score': round(urban, 2),
-                'actual_duration_mins': round(actual_duration, 2)
+                'urban_density_score': urban,
+                'actual_duration_mins': actual_duration
             })
             
         df = pd.DataFrame(data)
-        output_path = self.output_dir / "eta_prediction.csv"
-        df.to_csv(output_path, index=False)
+        df = df.round({
+            'distance_km': 2,
+            'base_duration_mins': 2,
+            'traffic_density_score': 2,
+            'weather_factor': 2,
+            'urban_density_score': 2,
+            'actual_duration_mins': 2
+        })
+        output_path = self._save(df, "eta_prediction.csv")
         print(f"✓ Generated {len(df)} ETA records → {output_path}")
         return df
 
@@ -502,16 +584,18 @@ class SyntheticDataGenerator:
         """Generate all synthetic datasets"""
         print("\n🔄 Generating synthetic training data...\n")
         
-        driver_df = self.generate_driver_data(n_drivers=150)
-        maintenance_df = self.generate_maintenance_data(n_vehicles=100)
-        demand_df = self.generate_demand_forecast_data(n_days=730)
+        # Each dataset gets its own seed offset so its output doesn't depend on
+        # which other datasets were generated before it
+        driver_df = self._with_seed_offset(0).generate_driver_data(n_drivers=150)
+        maintenance_df = self._with_seed_offset(1).generate_maintenance_data(n_vehicles=100)
+        demand_df = self._with_seed_offset(2).generate_demand_forecast_data(n_days=730)
         
         # New datasets
-        delay_df = self.generate_delay_prediction_data(n_samples=1000)
-        risk_df = self.generate_incident_risk_data(n_samples=1000)
-        fuel_df = self.generate_fuel_anomaly_data(n_samples=1000)
-        cluster_df = self.generate_driver_clustering_data(n_drivers=200)
-        eta_df = self.generate_eta_data(n_samples=1000)
+        delay_df = self._with_seed_offset(3).generate_delay_prediction_data(n_samples=1000)
+        risk_df = self._with_seed_offset(4).generate_incident_risk_data(n_samples=1000)
+        fuel_df = self._with_seed_offset(5).generate_fuel_anomaly_data(n_samples=1000)
+        cluster_df = self._with_seed_offset(6).generate_driver_clustering_data(n_drivers=200)
+        eta_df = self._with_seed_offset(7).generate_eta_data(n_samples=1000)
         
         print(f"\n✅ All datasets generated successfully!")
         print(f"\nDataset Statistics:")
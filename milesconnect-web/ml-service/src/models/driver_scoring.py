@@ -19,24 +19,27 @@ import joblib
 from pathlib import Path
 
 
+DRIVER_FIELDS = (
+    'total_trips',
+    'on_time_deliveries',
+    'late_deliveries',
+    'avg_speed_kmh',
+    'harsh_braking_count',
+    'harsh_acceleration_count',
+    'idle_time_mins',
+    'fuel_efficiency_kmpl',
+    'distance_km',
+    'experience_months',
+    'incident_count',
+    'customer_rating'
+)
+
+
 class DriverScoringModel:
     def __init__(self):
         self.model = None
         self.scaler = StandardScaler()
-        self.feature_columns = [
-            'total_trips',
-            'on_time_deliveries',
-            'late_deliveries',
-            'avg_speed_kmh',
-            'harsh_braking_count',
-            'harsh_acceleration_count',
-            'idle_time_mins',
-            'fuel_efficiency_kmpl',
-            'distance_km',
-            'experience_months',
-            'incident_count',
-            'customer_rating'
-        ]
+        self.feature_columns = list(DRIVER_FIELDS)
         
     def prepare_features(self, df):
         """Prepare features for model training/prediction"""
@@ -127,9 +130,13 @@ class DriverScoringModel:
         if self.model is None:
             raise ValueError("Model not trained or loaded")
         
-        # Convert to DataFrame if dict
+        # Convert to DataFrame if dict, list of dicts or feature array (DRIVER_FIELDS order)
         if isinstance(driver_data, dict):
             driver_data = pd.DataFrame([driver_data])
+        elif isinstance(driver_data, list):
+            driver_data = pd.DataFrame(driver_data)
+        elif isinstance(driver_data, np.ndarray):
+            driver_data = pd.DataFrame(np.atleast_2d(driver_data), columns=self.feature_columns)
         
         # Prepare features
         X = self.prepare_features(driver_data)
@@ -17,21 +17,24 @@ import joblib
 from pathlib import Path
 
 
+VEHICLE_FIELDS = (
+    'age_months',
+    'odometer_km',
+    'days_since_last_maintenance',
+    'total_trips',
+    'avg_trip_distance_km',
+    'harsh_usage_score',
+    'fuel_consumption_variance',
+    'reported_issues_count'
+)
+
+
 class MaintenancePredictionModel:
     def __init__(self):
         self.model = None
         self.scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
-        self.feature_columns = [
-            'age_months',
-            'odometer_km',
-            'days_since_last_maintenance',
-            'total_trips',
-            'avg_trip_distance_km',
-            'harsh_usage_score',
-            'fuel_consumption_variance',
-            'reported_issues_count'
-        ]
+        self.feature_columns = list(VEHICLE_FIELDS)
         self.class_names = ['immediate', 'normal', 'soon']  # Alphabetical order
         
     def prepare_features(self, df):
@@ -126,9 +129,11 @@ class MaintenancePredictionModel:
         if self.model is None:
             raise ValueError("Model not trained or loaded")
         
-        # Convert to DataFrame if dict
+        # Convert to DataFrame if dict or feature array (VEHICLE_FIELDS order)
         if isinstance(vehicle_data, dict):
             vehicle_data = pd.DataFrame([vehicle_data])
+        elif isinstance(vehicle_data, np.ndarray):
+            vehicle_data = pd.DataFrame(np.atleast_2d(vehicle_data), columns=self.feature_columns)
         
         # Prepare features
         X = self.prepare_features(vehicle_data)